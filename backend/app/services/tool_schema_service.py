@@ -1,7 +1,8 @@
 import logging
 import asyncio
+import time
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
 
 from fastmcp import Client
 from app.services.mcp_service import MCPService
@@ -9,22 +10,20 @@ from app.core.logging import log_exception
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class ToolSchema:
-    """Represents a tool schema for LLM consumption."""
-    name: str
-    description: str
-    parameters: Dict[str, Any]
-    tool_id: str  # MCP server tool ID
-    server_tool_name: str  # Actual tool name in the MCP server
+# Bounds for the per-server schema cache
+SCHEMA_CACHE_MAX_SIZE = 256
+SCHEMA_CACHE_TTL_SECONDS = 300
+
+# Upper bound on a single server's schema discovery, including a cold stdio start
+SCHEMA_DISCOVERY_TIMEOUT_SECONDS = 10.0
 
 class ToolSchemaService:
     """Service to generate LLM-compatible tool schemas from FastMCP servers."""
     
     def __init__(self, mcp_service: MCPService):
         self.mcp_service = mcp_service
-        self._schema_cache = {}  # Cache schemas to avoid repeated MCP calls
-        self._cache_valid = False
+        # tool_id -> (timestamp, schemas); LRU-ordered so it stays bounded
+        self._schema_cache: OrderedDict[str, tuple] = OrderedDict()
     
     async def get_tool_schemas_for_user(self, tool_ids: List[str], user_email: str) -> List[Dict[str, Any]]:
         """
@@ -60,6 +59,14 @@ class ToolSchemaService:
     
     async def _get_schemas_for_tool(self, tool_id: str, user_email: str) -> List[Dict[str, Any]]:
         """Get schemas for all tools in a specific MCP server."""
+        # No live client means the server is about to be (re)started and its tools may have changed
+        if tool_id not in self.mcp_service.mcp_clients:
+            self.invalidate_cache(tool_id)
+        
+        cached = self._get_cached_schemas(tool_id)
+        if cached is not None:
+            return cached
+
         try:
             tool_info = self.mcp_service.tools.get(tool_id)
             if not tool_info or tool_info['type'] != 'fastmcp':
@@ -72,27 +79,51 @@ class ToolSchemaService:
             # List all available tools from the MCP server
             mcp_tools = await client.list_tools()
             
-            schemas = []
-            for mcp_tool in mcp_tools:
-                schema = self._convert_mcp_tool_to_llm_schema(mcp_tool, tool_id)
-                if schema:
-                    schemas.append(schema)
+            convert = self._convert_mcp_tool_to_llm_schema
+            schemas = [
+                schema for mcp_tool in mcp_tools
+                if (schema := convert(mcp_tool, tool_id))
+            ]
             
+            self._cache_schemas(tool_id, schemas)
             return schemas
             
         except Exception as e:
             log_exception(logger, e, f"getting schemas for tool {tool_id}")
             return []
     
+    def _get_cached_schemas(self, tool_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached schemas for a tool if present and not expired."""
+        entry = self._schema_cache.get(tool_id)
+        if entry is None:
+            return None
+        
+        cached_at, schemas = entry
+        if time.monotonic() - cached_at > SCHEMA_CACHE_TTL_SECONDS:
+            del self._schema_cache[tool_id]
+            return None
+        
+        self._schema_cache.move_to_end(tool_id)
+        return list(schemas)
+    
+    def _cache_schemas(self, tool_id: str, schemas: List[Dict[str, Any]]):
+        """Store schemas for a tool, evicting the least recently used entry when full."""
+        self._schema_cache[tool_id] = (time.monotonic(), list(schemas))
+        self._schema_cache.move_to_end(tool_id)
+        if len(self._schema_cache) > SCHEMA_CACHE_MAX_SIZE:
+            self._schema_cache.popitem(last=False)
+    
     def _convert_mcp_tool_to_llm_schema(self, mcp_tool: Any, tool_id: str) -> Optional[Dict[str, Any]]:
         """Convert an MCP tool to LLM-compatible schema."""
+        # Bound before the try so the error path can reuse it without another lookup
+        tool_name = 'unknown'
         try:
             # Extract tool information
             tool_name = mcp_tool.name
-            description = getattr(mcp_tool, 'description', '') or f"Tool from {tool_id} MCP server"
+            description = getattr(mcp_tool, 'description', None) or f"Tool from {tool_id} MCP server"
             
             # Convert input schema to LLM format
-            input_schema = getattr(mcp_tool, 'inputSchema', {})
+            input_schema = getattr(mcp_tool, 'inputSchema', None) or {}
             
             # Build LLM-compatible schema
             llm_schema = {
@@ -112,7 +143,7 @@ class ToolSchemaService:
             return llm_schema
             
         except Exception as e:
-            log_exception(logger, e, f"converting MCP tool {getattr(mcp_tool, 'name', 'unknown')} to LLM schema")
+            log_exception(logger, e, f"converting MCP tool {tool_name} to LLM schema")
             return None
     
     def _convert_parameters_schema(self, input_schema: Dict[str, Any]) -> Dict[str, Any]:
@@ -126,15 +157,11 @@ class ToolSchemaService:
         
         # MCP schemas are typically JSON Schema format already
         # Ensure they have the required structure for LLM function calling
-        if "type" not in input_schema:
-            input_schema["type"] = "object"
-        
-        if "properties" not in input_schema:
-            input_schema["properties"] = {}
-            
-        if "required" not in input_schema:
-            input_schema["required"] = []
-        
+        # (setdefault does the membership test and insert in one lookup)
+        input_schema.setdefault("type", "object")
+        input_schema.setdefault("properties", {})
+        input_schema.setdefault("required", [])
+
         return input_schema
     
     async def execute_tool_call(self, function_name: str, arguments: Dict[str, Any], user_email: str) -> Dict[str, Any]:
@@ -197,13 +224,30 @@ class ToolSchemaService:
         try:
             available_tools = await self.mcp_service.get_available_tools(user_email)
             
+            tool_ids = [
+                tool['id'] for tool in available_tools
+                if tool.get('type') == 'fastmcp' and 'access_reason' not in tool
+            ]
+            
+            # Query servers concurrently; a slow or failing server only loses its own schemas
+            results = await asyncio.gather(
+                *(
+                    asyncio.wait_for(
+                        self._get_schemas_for_tool(tool_id, user_email),
+                        timeout=SCHEMA_DISCOVERY_TIMEOUT_SECONDS
+                    )
+                    for tool_id in tool_ids
+                ),
+                return_exceptions=True
+            )
+            
             all_schemas = {}
-            for tool in available_tools:
-                if tool.get('type') == 'fastmcp' and 'access_reason' not in tool:
-                    tool_id = tool['id']
-                    schemas = await self._get_schemas_for_tool(tool_id, user_email)
-                    if schemas:
-                        all_schemas[tool_id] = schemas
+            for tool_id, schemas in zip(tool_ids, results):
+                if isinstance(schemas, BaseException):
+                    log_exception(logger, schemas, f"schemas for {tool_id}")
+                    continue
+                if schemas:
+                    all_schemas[tool_id] = schemas
             
             return all_schemas
             
@@ -211,8 +255,10 @@ class ToolSchemaService:
             log_exception(logger, e, f"getting all available schemas for {user_email}")
             return {}
     
-    def invalidate_cache(self):
-        """Invalidate the schema cache to force refresh on next request."""
-        self._schema_cache.clear()
-        self._cache_valid = False
-        logger.debug("Tool schema cache invalidated")
\ No newline at end of file
+    def invalidate_cache(self, tool_id: Optional[str] = None):
+        """Invalidate cached schemas for one tool, or all tools, to force refresh on next request."""
+        if tool_id is None:
+            self._schema_cache.clear()
+            logger.debug("Tool schema cache invalidated")
+        elif self._schema_cache.pop(tool_id, None) is not None:
+            logger.debug(f"Tool schema cache invalidated for {tool_id}")
\ No newline at end of file
@@ -0,0 +1,159 @@
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+SERVER_PATH = Path(__file__).resolve().parents[2] / "mcp" / "ddg_search" / "server.py"
+
+spec = importlib.util.spec_from_file_location("ddg_search_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+class StubDDGS:
+    """Stands in for the shared DDGS client and records the queries it is asked for."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.queries = []
+
+    def start_search(self):
+        pass
+
+    def text(self, keywords, max_results, **params):
+        self.queries.append(keywords)
+        if self.error is not None:
+            raise self.error
+        return [{"title": keywords, "href": "https://example.com", "body": ""}]
+
+def _frozen_bucket(capacity=5):
+    # A refill rate this small keeps token counts exact for the length of a test
+    return server.TokenBucket(capacity, 1e-6, 1e-6, 1e-6)
+
+class TestTokenBucket:
+    def test_allows_burst_then_rejects_with_retry_after(self):
+        bucket = server.TokenBucket(5, 1.0, 0.2, 5.0)
+        assert all(bucket.acquire()[0] for _ in range(5))
+        allowed, retry_after = bucket.acquire()
+        assert not allowed
+        assert 0 < retry_after <= 1.0
+
+    def test_acquire_count_is_all_or_nothing(self):
+        bucket = _frozen_bucket()
+        assert bucket.acquire(3)[0]
+        assert not bucket.acquire(3)[0]
+        assert bucket.acquire(2)[0]
+
+    def test_success_increases_rate_up_to_max(self):
+        bucket = server.TokenBucket(5, 1.0, 0.2, 1.5)
+        bucket.success()
+        assert bucket.rate == pytest.approx(1.0 + server._rate_increase_step)
+        for _ in range(10):
+            bucket.success()
+        assert bucket.rate == 1.5
+
+    def test_rate_limited_halves_rate_and_drains(self):
+        bucket = server.TokenBucket(5, 1.0, 0.2, 5.0)
+        bucket.rate_limited()
+        assert bucket.rate == pytest.approx(0.5)
+        assert not bucket.acquire()[0]
+        for _ in range(10):
+            bucket.rate_limited()
+        assert bucket.rate == 0.2
+
+class TestSearch:
+    def setup_method(self):
+        self.ddgs = StubDDGS()
+        self.buckets = {search_type: _frozen_bucket() for search_type in server._buckets}
+        self.patches = [
+            patch.object(server, '_ddgs', self.ddgs),
+            patch.dict(server._buckets, self.buckets),
+            patch.dict(server._result_cache, clear=True),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def teardown_method(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+    @pytest.mark.asyncio
+    async def test_invalid_parameters_return_error(self):
+        assert await server._search("text", "  ", 10, "Search failed") == {"error": "Query cannot be empty"}
+        assert "error" in await server._search("text", "python", 0, "Search failed")
+        assert self.ddgs.queries == []
+
+    @pytest.mark.asyncio
+    async def test_empty_bucket_returns_rate_limited_envelope(self):
+        self.buckets["text"].acquire(5)
+        response = await server._search("text", "python", 10, "Search failed")
+        assert response["code"] == "agent.rate_limited"
+        assert response["retry_after"] > 0
+        assert response["query"] == "python"
+        assert self.ddgs.queries == []
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_backs_off(self):
+        self.ddgs.error = Exception("https://html.duckduckgo.com/html 202 Ratelimit")
+        bucket = server._buckets["text"] = server.TokenBucket(5, 1.0, 0.2, 5.0)
+        response = await server._search("text", "python", 10, "Search failed")
+        assert response["success"] is False
+        assert bucket.rate == pytest.approx(0.5)
+        assert not bucket.acquire()[0]
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_does_not_take_a_token(self):
+        await server._search("text", "python", 10, "Search failed")
+        self.buckets["text"].acquire(4)
+        response = await server._search("text", "python", 10, "Search failed")
+        assert response["success"] is True
+        assert self.ddgs.queries == ["python"]
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_is_a_copy(self):
+        first = await server._search("text", "python", 10, "Search failed")
+        first["results"].clear()
+        second = await server._search("text", "python", 10, "Search failed")
+        second["results"][0]["title"] = "changed"
+        third = await server._search("text", "python", 10, "Search failed")
+        assert third["results"][0]["title"] == "python"
+
+    @pytest.mark.asyncio
+    async def test_cache_entries_expire(self):
+        await server._search("text", "python", 10, "Search failed")
+        with patch.object(server, '_cache_ttl', -1):
+            await server._search("text", "python", 10, "Search failed")
+        assert self.ddgs.queries == ["python", "python"]
+
+    @pytest.mark.asyncio
+    async def test_batch_returns_results_in_order(self):
+        response = await server._search_batch("text", ["a", "b", "c"], 10, "Search failed")
+        assert response["n_queries"] == 3
+        assert [result["query"] for result in response["results"]] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_batch_validation(self):
+        assert "error" in await server._search_batch("text", [], 10, "Search failed")
+        too_many = [f"q{i}" for i in range(server._max_batch_queries + 1)]
+        assert "error" in await server._search_batch("text", too_many, 10, "Search failed")
+        assert self.ddgs.queries == []
+
+    @pytest.mark.asyncio
+    async def test_batch_rejected_as_a_whole(self):
+        self.buckets["text"].acquire(3)
+        response = await server._search_batch("text", ["a", "b", "c"], 10, "Search failed")
+        assert response["code"] == "agent.rate_limited"
+        assert response["retry_after"] > 0
+        assert response["n_queries"] == 3
+        assert "results" not in response
+        assert self.ddgs.queries == []
+        # Nothing was taken, so the remaining tokens still cover a smaller batch
+        assert self.buckets["text"].acquire(2)[0]
+
+    @pytest.mark.asyncio
+    async def test_batch_cached_queries_do_not_take_tokens(self):
+        await server._search("text", "a", 10, "Search failed")
+        response = await server._search_batch("text", ["a", "b", "c", "d", "e"], 10, "Search failed")
+        assert all(result["success"] for result in response["results"])
+        assert self.ddgs.queries == ["a", "b", "c", "d", "e"]
+        assert not self.buckets["text"].acquire()[0]
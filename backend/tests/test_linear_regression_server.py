@@ -0,0 +1,56 @@
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+SERVER_PATH = Path(__file__).resolve().parents[2] / "mcp" / "linear_regression" / "server.py"
+
+spec = importlib.util.spec_from_file_location("linear_regression_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+def _sample_data(n=1000):
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-50.0, 50.0, n)
+    y = 3.0 * x - 7.0 + rng.normal(0.0, 5.0, n)
+    return x, y
+
+class TestCenteredMoments:
+    def test_loop_matches_numpy(self):
+        x, y = _sample_data(50)
+        np.testing.assert_allclose(
+            server._centered_moments_loop(x, y),
+            server._centered_moments_numpy(x, y),
+            rtol=1e-9
+        )
+
+    def test_compiled_kernel_matches_numpy(self):
+        pytest.importorskip("numba")
+        assert server._centered_moments is not server._centered_moments_numpy
+        x, y = _sample_data()
+        np.testing.assert_allclose(
+            server._centered_moments(x, y),
+            server._centered_moments_numpy(x, y),
+            rtol=1e-9
+        )
+
+class TestFit:
+    def test_fit_recovers_line(self):
+        result = server.fit([0.0, 1.0, 2.0, 3.0], [1.0, 3.0, 5.0, 7.0])
+        assert result.slope == pytest.approx(2.0)
+        assert result.intercept == pytest.approx(1.0)
+        assert result.r_squared == pytest.approx(1.0)
+        assert result.n_points == 4
+
+    @pytest.mark.parametrize("kernel", ["compiled", "numpy"])
+    def test_fit_rejects_all_equal_x(self, kernel):
+        if kernel == "compiled":
+            pytest.importorskip("numba")
+            moments = server._centered_moments
+        else:
+            moments = server._centered_moments_numpy
+        with patch.object(server, '_centered_moments', moments):
+            with pytest.raises(ValueError, match="all X values are the same"):
+                server.fit([2.5, 2.5, 2.5], [1.0, 2.0, 3.0])
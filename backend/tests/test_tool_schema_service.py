@@ -0,0 +1,75 @@
+import pytest
+import os
+import asyncio
+from unittest.mock import patch
+from app.services.mcp_service import MCPService
+from app.services import tool_schema_service
+from app.services.tool_schema_service import ToolSchemaService
+
+class TestToolSchemaService:
+    def setup_method(self):
+        with patch.dict(os.environ, {'DEBUG': 'true'}):
+            self.tool_schema_service = ToolSchemaService(MCPService())
+
+    def test_cached_schemas_returned(self):
+        schemas = [{"type": "function", "function": {"name": "filesystem_read_file"}}]
+        self.tool_schema_service._cache_schemas("filesystem", schemas)
+        assert self.tool_schema_service._get_cached_schemas("filesystem") == schemas
+
+    def test_cache_evicts_least_recently_used(self):
+        with patch.object(tool_schema_service, 'SCHEMA_CACHE_MAX_SIZE', 2):
+            self.tool_schema_service._cache_schemas("a", [])
+            self.tool_schema_service._cache_schemas("b", [])
+            self.tool_schema_service._get_cached_schemas("a")
+            self.tool_schema_service._cache_schemas("c", [])
+        assert self.tool_schema_service._get_cached_schemas("a") == []
+        assert self.tool_schema_service._get_cached_schemas("b") is None
+
+    def test_cache_entries_expire(self):
+        self.tool_schema_service._cache_schemas("filesystem", [])
+        with patch.object(tool_schema_service, 'SCHEMA_CACHE_TTL_SECONDS', -1):
+            assert self.tool_schema_service._get_cached_schemas("filesystem") is None
+
+    def test_invalidate_cache(self):
+        self.tool_schema_service._cache_schemas("filesystem", [])
+        self.tool_schema_service.invalidate_cache()
+        assert self.tool_schema_service._get_cached_schemas("filesystem") is None
+
+    @pytest.mark.asyncio
+    async def test_cache_dropped_when_client_not_live(self):
+        stale = [{"type": "function", "function": {"name": "filesystem_removed_tool"}}]
+        self.tool_schema_service._cache_schemas("filesystem", stale)
+        self.tool_schema_service.mcp_service.mcp_clients.pop("filesystem", None)
+        with patch.object(self.tool_schema_service.mcp_service, '_get_mcp_client', side_effect=RuntimeError("server restarting")):
+            schemas = await self.tool_schema_service._get_schemas_for_tool("filesystem", "test@test.com")
+        assert schemas == []
+        assert self.tool_schema_service._get_cached_schemas("filesystem") is None
+
+    def test_invalidate_cache_single_tool(self):
+        self.tool_schema_service._cache_schemas("filesystem", [])
+        self.tool_schema_service._cache_schemas("ddg_search", [])
+        self.tool_schema_service.invalidate_cache("filesystem")
+        assert self.tool_schema_service._get_cached_schemas("filesystem") is None
+        assert self.tool_schema_service._get_cached_schemas("ddg_search") == []
+
+    @pytest.mark.asyncio
+    async def test_failing_servers_do_not_drop_sibling_schemas(self):
+        available_tools = [
+            {"id": "good", "type": "fastmcp"},
+            {"id": "raising", "type": "fastmcp"},
+            {"id": "hanging", "type": "fastmcp"},
+        ]
+
+        async def get_schemas(tool_id, user_email):
+            if tool_id == "raising":
+                raise RuntimeError("server crashed")
+            if tool_id == "hanging":
+                await asyncio.sleep(60)
+            return [{"type": "function", "function": {"name": f"{tool_id}_tool"}}]
+
+        with patch.object(self.tool_schema_service.mcp_service, 'get_available_tools', return_value=available_tools), \
+             patch.object(self.tool_schema_service, '_get_schemas_for_tool', side_effect=get_schemas), \
+             patch.object(tool_schema_service, 'SCHEMA_DISCOVERY_TIMEOUT_SECONDS', 0.1):
+            all_schemas = await self.tool_schema_service.get_all_available_schemas("test@test.com")
+
+        assert all_schemas == {"good": [{"type": "function", "function": {"name": "good_tool"}}]}
@@ -3,9 +3,13 @@
 DuckDuckGo Search MCP Server
 Provides web search functionality using DuckDuckGo.
 """
+import copy
 import json
 import time
-from typing import List, Dict, Any, Optional
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from fastmcp import FastMCP
 
@@ -13,8 +17,23 @@ from fastmcp import FastMCP
 mcp = FastMCP("DuckDuckGoSearch")
 
 # Rate limiting configuration
-_last_search_time = 0
-_min_search_interval = 1.0  # seconds between searches
+_bucket_capacity = 5  # searches allowed in a burst
+_bucket_refill_rate = 1.0  # initial tokens added per second
+_bucket_min_rate = 0.2
+_bucket_max_rate = 5.0
+_rate_increase_step = 0.2  # additive increase after each successful search
+_rate_decrease_factor = 0.5  # multiplicative decrease when DuckDuckGo throttles us
+
+# Upper bound on queries accepted by the batch search tools. A batch reserves its
+# tokens up front, so it can't be larger than the burst capacity.
+_max_batch_queries = _bucket_capacity
+
+# Result cache for repeated identical searches
+_cache_max_size = 256
+_cache_ttl = 300  # seconds
+
+# Substrings DuckDuckGo uses in errors when it rate limits a client
+_RATE_LIMIT_MARKERS = ("Ratelimit", "429")
 
 try:
     from duckduckgo_search import DDGS
@@ -22,29 +41,303 @@ try:
 except ImportError:
     DDGS_AVAILABLE = False
 
-def _check_rate_limit():
-    """Enforce rate limiting between searches."""
-    global _last_search_time
-    current_time = time.time()
+if DDGS_AVAILABLE:
+    class _SharedDDGS(DDGS):
+        """
+        DDGS client meant to be reused across searches.
+        
+        DDGS sleeps 0.75s before any request made within 20s of the instance's
+        previous one, which on a shared client delays every search after the
+        first. Here the pause only spaces out the requests of one search, as it
+        did with a fresh client per call; the token buckets pace whole searches.
+        """
+        
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # Searches run on worker threads, so whether a search has sent a request is per thread
+            self._search_state = threading.local()
+        
+        def start_search(self):
+            """Forget the previous search's requests before starting a new one on this thread."""
+            self._search_state.requested = False
+        
+        def _sleep(self, sleeptime: float = 0.75) -> None:
+            if getattr(self._search_state, "requested", False):
+                time.sleep(sleeptime)
+            self._search_state.requested = True
+
+# Shared client so searches reuse one HTTP connection pool instead of a new session per call.
+# Created on first search so importing the server does not open a session.
+_ddgs = None
+_ddgs_lock = threading.Lock()
+
+def _get_ddgs():
+    """Return the shared DDGS client, creating it on first use."""
+    global _ddgs
+    if _ddgs is None:
+        with _ddgs_lock:
+            if _ddgs is None:
+                _ddgs = _SharedDDGS()
+    return _ddgs
+
+class TokenBucket:
+    """
+    Token bucket rate limiter allowing short bursts up to capacity.
+    
+    The refill rate adapts AIMD-style: it grows slowly while searches succeed
+    and halves when DuckDuckGo signals a rate limit.
+    """
+    
+    def __init__(self, capacity: float, rate: float, min_rate: float, max_rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.tokens = capacity
+        self.timestamp = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, count: int = 1) -> Tuple[bool, float]:
+        """Take count tokens if available; otherwise take none and return the seconds until they are."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.timestamp) * self.rate)
+            self.timestamp = now
+            
+            if self.tokens >= count:
+                self.tokens -= count
+                return True, 0.0
+            
+            return False, (count - self.tokens) / self.rate
+    
+    def success(self):
+        """Additively increase the refill rate after a successful search."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + _rate_increase_step)
+    
+    def rate_limited(self):
+        """Multiplicatively decrease the refill rate and drain the bucket."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * _rate_decrease_factor)
+            self.tokens = 0
+
+# DuckDuckGo throttles this server's single egress IP, and every user reaches it through
+# the backend's one MCP session, so buckets are shared and kept per search type only;
+# a burst of image searches doesn't starve text searches
+_buckets = {
+    search_type: TokenBucket(_bucket_capacity, _bucket_refill_rate, _bucket_min_rate, _bucket_max_rate)
+    for search_type in ("text", "news", "images", "videos")
+}
+
+# (search type, parameters...) -> (cached_at, response)
+_result_cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_hits = 0
+_cache_misses = 0
+
+def _get_cached_result(key: tuple) -> Optional[Dict[str, Any]]:
+    """Return a copy of a cached search response if present and not expired."""
+    global _cache_hits, _cache_misses
+    with _cache_lock:
+        entry = _result_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] <= _cache_ttl:
+            _result_cache.move_to_end(key)
+            _cache_hits += 1
+            # Callers own the response they get back; mutating it must not change later hits
+            return copy.deepcopy(entry[1])
+        
+        if entry is not None:
+            del _result_cache[key]
+        _cache_misses += 1
+        return None
+
+def _cache_result(key: tuple, response: Dict[str, Any]):
+    """Cache a copy of a successful search response, evicting the least recently used entry when full."""
+    response = copy.deepcopy(response)
+    with _cache_lock:
+        _result_cache[key] = (time.monotonic(), response)
+        _result_cache.move_to_end(key)
+        if len(_result_cache) > _cache_max_size:
+            _result_cache.popitem(last=False)
+
+def _rate_limited_response(retry_after: float, **context: Any) -> Dict[str, Any]:
+    """Build the error returned when a search or batch is rejected by the rate limiter."""
+    return {
+        "success": False,
+        "error": f"Rate limit exceeded, retry after {retry_after:.2f} seconds",
+        "code": "agent.rate_limited",
+        "retry_after": retry_after,
+        **context
+    }
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Check whether a search error means DuckDuckGo is throttling us."""
+    message = str(error)
+    return any(marker in message for marker in _RATE_LIMIT_MARKERS)
+
+def _run_search(method: str, **kwargs) -> List[Dict[str, Any]]:
+    """Run a blocking DDGS search on the shared client. Called from a worker thread."""
+    bucket = _buckets[method]
+    ddgs = _get_ddgs()
+    ddgs.start_search()
+    try:
+        results = getattr(ddgs, method)(**kwargs)
+    except Exception as e:
+        if _is_rate_limit_error(e):
+            bucket.rate_limited()
+        raise
+    
+    bucket.success()
+    return results
+
+class _ValidationError(ValueError):
+    """Raised when search parameters are invalid."""
+
+def _validate_search_params(query: str, max_results: int):
+    """Validate search parameters, raising _ValidationError on the first problem."""
+    if not query.strip():
+        raise _ValidationError("Query cannot be empty")
+    
+    if not 1 <= max_results <= 50:
+        raise _ValidationError("max_results must be between 1 and 50")
+
+def _validate_batch_queries(queries: List[str]):
+    """Validate the query list of a batch search, raising _ValidationError on failure."""
+    if not queries:
+        raise _ValidationError("queries cannot be empty")
+    
+    if len(queries) > _max_batch_queries:
+        raise _ValidationError(f"At most {_max_batch_queries} queries per batch")
+
+def _check_search(
+    search_type: str,
+    query: str,
+    max_results: int,
+    params: Dict[str, Any]
+) -> Tuple[tuple, Optional[Dict[str, Any]]]:
+    """
+    Run the checks that can answer a search without contacting DuckDuckGo.
+    
+    Returns the cache key and, when the search is already answered (library
+    missing, invalid parameters or a cached result), the response to return.
+    """
+    cache_key = (search_type, query, max_results, *params.values())
+    
+    if not DDGS_AVAILABLE:
+        return cache_key, {
+            "error": "DuckDuckGo search library not available. Install with: pip install duckduckgo-search"
+        }
+    
+    # Validate parameters
+    try:
+        _validate_search_params(query, max_results)
+    except _ValidationError as e:
+        return cache_key, {"error": str(e)}
+    
+    return cache_key, _get_cached_result(cache_key)
+
+async def _execute_search(
+    cache_key: tuple,
+    search_type: str,
+    query: str,
+    max_results: int,
+    error_label: str,
+    params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Run a search whose rate-limit token is already taken, in a worker thread."""
+    try:
+        results = await asyncio.to_thread(
+            _run_search,
+            search_type,
+            keywords=query,
+            max_results=max_results,
+            **params
+        )
+        
+        response = {
+            "success": True,
+            "query": query,
+            **params,
+            "results_count": len(results),
+            "timestamp": datetime.now().isoformat(),
+            "results": results
+        }
+        _cache_result(cache_key, response)
+        return response
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"{error_label}: {str(e)}",
+            "query": query
+        }
+
+async def _search(
+    search_type: str,
+    query: str,
+    max_results: int,
+    error_label: str,
+    **params: Any
+) -> Dict[str, Any]:
+    """
+    Run one search of the given type and build its response.
     
-    if current_time - _last_search_time < _min_search_interval:
-        sleep_time = _min_search_interval - (current_time - _last_search_time)
-        time.sleep(sleep_time)
+    Validates, serves repeats from the cache, applies the rate limiter and
+    runs the blocking search in a thread.
+    """
+    cache_key, response = _check_search(search_type, query, max_results, params)
+    if response is not None:
+        return response
+    
+    allowed, retry_after = _buckets[search_type].acquire()
+    if not allowed:
+        return _rate_limited_response(retry_after, query=query)
     
-    _last_search_time = time.time()
+    return await _execute_search(cache_key, search_type, query, max_results, error_label, params)
 
-def _validate_search_params(query: str, max_results: int) -> Dict[str, Any]:
-    """Validate search parameters."""
-    if not query or not query.strip():
-        return {"error": "Query cannot be empty"}
+async def _search_batch(
+    search_type: str,
+    queries: List[str],
+    max_results: int,
+    error_label: str,
+    **params: Any
+) -> Dict[str, Any]:
+    """
+    Run several searches of one type concurrently; each result has its own envelope.
+    
+    Tokens for every query that needs DuckDuckGo are reserved up front, so a
+    batch either runs in full or is rejected as a whole with one retry_after.
+    """
+    try:
+        _validate_batch_queries(queries)
+    except _ValidationError as e:
+        return {"error": str(e)}
     
-    if max_results < 1 or max_results > 50:
-        return {"error": "max_results must be between 1 and 50"}
+    checked = [_check_search(search_type, query, max_results, params) for query in queries]
+    pending = [i for i, (_, response) in enumerate(checked) if response is None]
     
-    return {}
+    results = [response for _, response in checked]
+    if pending:
+        allowed, retry_after = _buckets[search_type].acquire(len(pending))
+        if not allowed:
+            return _rate_limited_response(retry_after, n_queries=len(queries))
+        
+        searched = await asyncio.gather(
+            *(
+                _execute_search(checked[i][0], search_type, queries[i], max_results, error_label, params)
+                for i in pending
+            )
+        )
+        for i, response in zip(pending, searched):
+            results[i] = response
+    
+    return {
+        "results": results,
+        "n_queries": len(queries)
+    }
 
 @mcp.tool
-def search_text(
+async def search_text(
     query: str, 
     max_results: int = 10,
     region: str = "wt-wt",
@@ -64,48 +357,13 @@ def search_text(
     Returns:
         Dictionary containing search results and metadata
     """
-    if not DDGS_AVAILABLE:
-        return {
-            "error": "DuckDuckGo search library not available. Install with: pip install duckduckgo-search"
-        }
-    
-    # Validate parameters
-    validation_error = _validate_search_params(query, max_results)
-    if validation_error:
-        return validation_error
-    
-    try:
-        _check_rate_limit()
-        
-        with DDGS() as ddgs:
-            results = ddgs.text(
-                keywords=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                max_results=max_results
-            )
-            
-            return {
-                "success": True,
-                "query": query,
-                "region": region,
-                "safesearch": safesearch,
-                "timelimit": timelimit,
-                "results_count": len(results),
-                "timestamp": datetime.now().isoformat(),
-                "results": results
-            }
-            
-    except Exception as e:
-        return {
-            "success": False,
-            "error": f"Search failed: {str(e)}",
-            "query": query
-        }
+    return await _search(
+        "text", query, max_results, "Search failed",
+        region=region, safesearch=safesearch, timelimit=timelimit
+    )
 
 @mcp.tool
-def search_news(
+async def search_news(
     query: str,
     max_results: int = 10,
     region: str = "wt-wt",
@@ -125,48 +383,13 @@ def search_news(
     Returns:
         Dictionary containing news search results and metadata
     """
-    if not DDGS_AVAILABLE:
-        return {
-            "error": "DuckDuckGo search library not available. Install with: pip install duckduckgo-search"
-        }
-    
-    # Validate parameters
-    validation_error = _validate_search_params(query, max_results)
-    if validation_error:
-        return validation_error
-    
-    try:
-        _check_rate_limit()
-        
-        with DDGS() as ddgs:
-            results = ddgs.news(
-                keywords=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                max_results=max_results
-            )
-            
-            return {
-                "success": True,
-                "query": query,
-                "region": region,
-                "safesearch": safesearch,
-                "timelimit": timelimit,
-                "results_count": len(results),
-                "timestamp": datetime.now().isoformat(),
-                "results": results
-            }
-            
-    except Exception as e:
-        return {
-            "success": False,
-            "error": f"News search failed: {str(e)}",
-            "query": query
-        }
+    return await _search(
+        "news", query, max_results, "News search failed",
+        region=region, safesearch=safesearch, timelimit=timelimit
+    )
 
 @mcp.tool
-def search_images(
+async def search_images(
     query: str,
     max_results: int = 10,
     region: str = "wt-wt",
@@ -190,52 +413,13 @@ def search_images(
     Returns:
         Dictionary containing image search results and metadata
     """
-    if not DDGS_AVAILABLE:
-        return {
-            "error": "DuckDuckGo search library not available. Install with: pip install duckduckgo-search"
-        }
-    
-    # Validate parameters
-    validation_error = _validate_search_params(query, max_results)
-    if validation_error:
-        return validation_error
-    
-    try:
-        _check_rate_limit()
-        
-        with DDGS() as ddgs:
-            results = ddgs.images(
-                keywords=query,
-                region=region,
-                safesearch=safesearch,
-                size=size,
-                color=color,
-                type_image=type_image,
-                max_results=max_results
-            )
-            
-            return {
-                "success": True,
-                "query": query,
-                "region": region,
-                "safesearch": safesearch,
-                "size": size,
-                "color": color,
-                "type_image": type_image,
-                "results_count": len(results),
-                "timestamp": datetime.now().isoformat(),
-                "results": results
-            }
-            
-    except Exception as e:
-        return {
-            "success": False,
-            "error": f"Image search failed: {str(e)}",
-            "query": query
-        }
+    return await _search(
+        "images", query, max_results, "Image search failed",
+        region=region, safesearch=safesearch, size=size, color=color, type_image=type_image
+    )
 
 @mcp.tool
-def search_videos(
+async def search_videos(
     query: str,
     max_results: int = 10,
     region: str = "wt-wt",
@@ -259,49 +443,124 @@ def search_videos(
     Returns:
         Dictionary containing video search results and metadata
     """
-    if not DDGS_AVAILABLE:
-        return {
-            "error": "DuckDuckGo search library not available. Install with: pip install duckduckgo-search"
-        }
+    return await _search(
+        "videos", query, max_results, "Video search failed",
+        region=region, safesearch=safesearch, timelimit=timelimit,
+        resolution=resolution, duration=duration
+    )
+
+@mcp.tool
+async def search_text_batch(
+    queries: List[str],
+    max_results: int = 10,
+    region: str = "wt-wt",
+    safesearch: str = "moderate",
+    timelimit: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run several text searches concurrently using DuckDuckGo.
     
-    # Validate parameters
-    validation_error = _validate_search_params(query, max_results)
-    if validation_error:
-        return validation_error
+    Args:
+        queries: Search query strings (1-5)
+        max_results: Maximum number of results per query (1-50)
+        region: Search region (e.g., "wt-wt", "us-en", "uk-en")
+        safesearch: Safe search setting ("on", "moderate", "off")
+        timelimit: Time limit for results ("d", "w", "m", "y")
     
-    try:
-        _check_rate_limit()
-        
-        with DDGS() as ddgs:
-            results = ddgs.videos(
-                keywords=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                resolution=resolution,
-                duration=duration,
-                max_results=max_results
-            )
-            
-            return {
-                "success": True,
-                "query": query,
-                "region": region,
-                "safesearch": safesearch,
-                "timelimit": timelimit,
-                "resolution": resolution,
-                "duration": duration,
-                "results_count": len(results),
-                "timestamp": datetime.now().isoformat(),
-                "results": results
-            }
-            
-    except Exception as e:
-        return {
-            "success": False,
-            "error": f"Video search failed: {str(e)}",
-            "query": query
-        }
+    Returns:
+        Dictionary containing one search_text result per query, in order
+    """
+    return await _search_batch(
+        "text", queries, max_results, "Search failed",
+        region=region, safesearch=safesearch, timelimit=timelimit
+    )
+
+@mcp.tool
+async def search_news_batch(
+    queries: List[str],
+    max_results: int = 10,
+    region: str = "wt-wt",
+    safesearch: str = "moderate",
+    timelimit: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run several news searches concurrently using DuckDuckGo.
+    
+    Args:
+        queries: Search query strings (1-5)
+        max_results: Maximum number of results per query (1-50)
+        region: Search region (e.g., "wt-wt", "us-en", "uk-en")
+        safesearch: Safe search setting ("on", "moderate", "off")
+        timelimit: Time limit for results ("d", "w", "m")
+    
+    Returns:
+        Dictionary containing one search_news result per query, in order
+    """
+    return await _search_batch(
+        "news", queries, max_results, "News search failed",
+        region=region, safesearch=safesearch, timelimit=timelimit
+    )
+
+@mcp.tool
+async def search_images_batch(
+    queries: List[str],
+    max_results: int = 10,
+    region: str = "wt-wt",
+    safesearch: str = "moderate",
+    size: Optional[str] = None,
+    color: Optional[str] = None,
+    type_image: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run several image searches concurrently using DuckDuckGo.
+    
+    Args:
+        queries: Search query strings (1-5)
+        max_results: Maximum number of results per query (1-50)
+        region: Search region (e.g., "wt-wt", "us-en", "uk-en")
+        safesearch: Safe search setting ("on", "moderate", "off")
+        size: Image size ("Small", "Medium", "Large", "Wallpaper")
+        color: Color filter (e.g., "Red", "Blue", "Monochrome")
+        type_image: Image type ("photo", "clipart", "gif", "transparent", "line")
+    
+    Returns:
+        Dictionary containing one search_images result per query, in order
+    """
+    return await _search_batch(
+        "images", queries, max_results, "Image search failed",
+        region=region, safesearch=safesearch, size=size, color=color, type_image=type_image
+    )
+
+@mcp.tool
+async def search_videos_batch(
+    queries: List[str],
+    max_results: int = 10,
+    region: str = "wt-wt",
+    safesearch: str = "moderate",
+    timelimit: Optional[str] = None,
+    resolution: Optional[str] = None,
+    duration: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run several video searches concurrently using DuckDuckGo.
+    
+    Args:
+        queries: Search query strings (1-5)
+        max_results: Maximum number of results per query (1-50)
+        region: Search region (e.g., "wt-wt", "us-en", "uk-en")
+        safesearch: Safe search setting ("on", "moderate", "off")
+        timelimit: Time limit for results ("d", "w", "m")
+        resolution: Video resolution ("high", "standard")
+        duration: Video duration ("short", "medium", "long")
+    
+    Returns:
+        Dictionary containing one search_videos result per query, in order
+    """
+    return await _search_batch(
+        "videos", queries, max_results, "Video search failed",
+        region=region, safesearch=safesearch, timelimit=timelimit,
+        resolution=resolution, duration=duration
+    )
 
 @mcp.tool
 def get_search_status() -> Dict[str, Any]:
@@ -316,15 +575,30 @@ def get_search_status() -> Dict[str, Any]:
         "ddgs_library_available": DDGS_AVAILABLE,
         "rate_limiting": {
             "enabled": True,
-            "min_interval_seconds": _min_search_interval
+            "strategy": "token_bucket",
+            "scope": "shared per search type",
+            "burst_capacity": _bucket_capacity,
+            "refill_rate_bounds": [_bucket_min_rate, _bucket_max_rate],
+            "current_refill_rates": {
+                search_type: bucket.rate for search_type, bucket in _buckets.items()
+            }
         },
         "capabilities": {
             "text_search": DDGS_AVAILABLE,
             "news_search": DDGS_AVAILABLE,
             "image_search": DDGS_AVAILABLE,
-            "video_search": DDGS_AVAILABLE
+            "video_search": DDGS_AVAILABLE,
+            "batch_search": DDGS_AVAILABLE
+        },
+        "cache": {
+            "max_entries": _cache_max_size,
+            "ttl_seconds": _cache_ttl,
+            "entries": len(_result_cache),
+            "cache_hits": _cache_hits,
+            "cache_misses": _cache_misses
         },
         "max_results_limit": 50,
+        "max_batch_queries": _max_batch_queries,
         "supported_regions": [
             "wt-wt (No region)", "us-en (United States)", "uk-en (United Kingdom)",
             "de-de (Germany)", "fr-fr (France)", "es-es (Spain)", "it-it (Italy)",
@@ -334,84 +608,92 @@ def get_search_status() -> Dict[str, Any]:
         "timelimit_options": ["d (day)", "w (week)", "m (month)", "y (year)"]
     }
 
+_SEARCH_GUIDE_JSON = json.dumps({
+    "description": "DuckDuckGo Search MCP Server - Web search functionality",
+    "installation": {
+        "required_package": "duckduckgo-search",
+        "install_command": "pip install duckduckgo-search"
+    },
+    "tools": {
+        "search_text": "Search for web pages and text content",
+        "search_news": "Search for news articles",
+        "search_images": "Search for images with filtering options",
+        "search_videos": "Search for videos with quality/duration filters",
+        "search_text_batch": "Run several text searches concurrently",
+        "search_news_batch": "Run several news searches concurrently",
+        "search_images_batch": "Run several image searches concurrently",
+        "search_videos_batch": "Run several video searches concurrently",
+        "get_search_status": "Check service status and capabilities"
+    },
+    "search_operators": {
+        "exact_phrase": 'Use quotes: "cats and dogs"',
+        "exclude_terms": 'Use minus: cats -dogs',
+        "include_terms": 'Use plus: cats +dogs',
+        "file_types": 'Use filetype: cats filetype:pdf',
+        "site_search": 'Use site: dogs site:example.com',
+        "title_search": 'Use intitle: intitle:dogs',
+        "url_search": 'Use inurl: inurl:cats'
+    },
+    "parameters": {
+        "region": "Search region (wt-wt for worldwide, us-en for US, etc.)",
+        "safesearch": "Content filtering (on/moderate/off)",
+        "timelimit": "Time filter (d/w/m/y for day/week/month/year)",
+        "max_results": "Number of results (1-50)"
+    },
+    "rate_limiting": {
+        "enabled": True,
+        "burst_capacity": "Up to 5 searches at once per search type, shared by all callers",
+        "adaptive_rate": "Refill rate starts at 1 per second, grows while searches succeed and halves when DuckDuckGo throttles",
+        "when_limited": "Searches fail fast with code agent.rate_limited and a retry_after hint",
+        "purpose": "Prevent API abuse and ensure service stability"
+    },
+    "best_practices": [
+        "Use specific keywords for better results",
+        "Combine search operators for precise queries",
+        "Respect rate limits to maintain service availability",
+        "Check search_status before making requests",
+        "Use appropriate max_results to balance speed and comprehensiveness"
+    ]
+}, indent=2)
+
 @mcp.resource("file://search_guide")
 def get_search_guide() -> str:
     """Get a comprehensive guide for using DuckDuckGo search tools."""
-    guide = {
-        "description": "DuckDuckGo Search MCP Server - Web search functionality",
-        "installation": {
-            "required_package": "duckduckgo-search",
-            "install_command": "pip install duckduckgo-search"
-        },
-        "tools": {
-            "search_text": "Search for web pages and text content",
-            "search_news": "Search for news articles",
-            "search_images": "Search for images with filtering options",
-            "search_videos": "Search for videos with quality/duration filters",
-            "get_search_status": "Check service status and capabilities"
-        },
-        "search_operators": {
-            "exact_phrase": 'Use quotes: "cats and dogs"',
-            "exclude_terms": 'Use minus: cats -dogs',
-            "include_terms": 'Use plus: cats +dogs',
-            "file_types": 'Use filetype: cats filetype:pdf',
-            "site_search": 'Use site: dogs site:example.com',
-            "title_search": 'Use intitle: intitle:dogs',
-            "url_search": 'Use inurl: inurl:cats'
-        },
-        "parameters": {
-            "region": "Search region (wt-wt for worldwide, us-en for US, etc.)",
-            "safesearch": "Content filtering (on/moderate/off)",
-            "timelimit": "Time filter (d/w/m/y for day/week/month/year)",
-            "max_results": "Number of results (1-50)"
-        },
-        "rate_limiting": {
-            "enabled": True,
-            "min_interval": "1 second between searches",
-            "purpose": "Prevent API abuse and ensure service stability"
-        },
-        "best_practices": [
-            "Use specific keywords for better results",
-            "Combine search operators for precise queries",
-            "Respect rate limits to maintain service availability",
-            "Check search_status before making requests",
-            "Use appropriate max_results to balance speed and comprehensiveness"
-        ]
-    }
-    return json.dumps(guide, indent=2)
+    return _SEARCH_GUIDE_JSON
+
+_REGION_CODES_JSON = json.dumps({
+    "regions": {
+        "wt-wt": "No region (worldwide)",
+        "us-en": "United States",
+        "uk-en": "United Kingdom", 
+        "ca-en": "Canada",
+        "ca-fr": "Canada (French)",
+        "au-en": "Australia",
+        "de-de": "Germany",
+        "fr-fr": "France",
+        "es-es": "Spain",
+        "it-it": "Italy",
+        "nl-nl": "Netherlands",
+        "ru-ru": "Russia",
+        "jp-jp": "Japan",
+        "kr-kr": "Korea",
+        "cn-zh": "China",
+        "in-en": "India",
+        "br-pt": "Brazil",
+        "mx-es": "Mexico",
+        "ar-es": "Argentina",
+        "se-sv": "Sweden",
+        "no-no": "Norway",
+        "dk-da": "Denmark",
+        "fi-fi": "Finland"
+    },
+    "note": "Use these codes in the 'region' parameter for localized search results"
+}, indent=2)
 
 @mcp.resource("file://region_codes")
 def get_region_codes() -> str:
     """Get a list of supported region codes for searches."""
-    regions = {
-        "regions": {
-            "wt-wt": "No region (worldwide)",
-            "us-en": "United States",
-            "uk-en": "United Kingdom", 
-            "ca-en": "Canada",
-            "ca-fr": "Canada (French)",
-            "au-en": "Australia",
-            "de-de": "Germany",
-            "fr-fr": "France",
-            "es-es": "Spain",
-            "it-it": "Italy",
-            "nl-nl": "Netherlands",
-            "ru-ru": "Russia",
-            "jp-jp": "Japan",
-            "kr-kr": "Korea",
-            "cn-zh": "China",
-            "in-en": "India",
-            "br-pt": "Brazil",
-            "mx-es": "Mexico",
-            "ar-es": "Argentina",
-            "se-sv": "Sweden",
-            "no-no": "Norway",
-            "dk-da": "Denmark",
-            "fi-fi": "Finland"
-        },
-        "note": "Use these codes in the 'region' parameter for localized search results"
-    }
-    return json.dumps(regions, indent=2)
+    return _REGION_CODES_JSON
 
 if __name__ == "__main__":
     mcp.run()
\ No newline at end of file
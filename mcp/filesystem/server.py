@@ -5,6 +5,8 @@ Provides safe file operations in a playground directory.
 """
 import os
 import json
+import stat
+import threading
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from fastmcp import FastMCP
@@ -15,16 +17,16 @@ mcp = FastMCP("FileSystem")
 # Define the safe playground directory
 PLAYGROUND_DIR = Path(__file__).parent.parent.parent / "playground"
 PLAYGROUND_DIR.mkdir(exist_ok=True)
+_PLAYGROUND_ABS = PLAYGROUND_DIR.resolve()
 
 def _ensure_safe_path(path: str) -> Path:
     """Ensure the path is within the playground directory."""
     try:
         # Resolve the path and ensure it's within playground
-        full_path = (PLAYGROUND_DIR / path).resolve()
-        playground_abs = PLAYGROUND_DIR.resolve()
+        full_path = (_PLAYGROUND_ABS / path).resolve()
         
         # Check if the resolved path is within the playground directory
-        if not str(full_path).startswith(str(playground_abs)):
+        if not full_path.is_relative_to(_PLAYGROUND_ABS):
             raise ValueError(f"Path {path} is outside the safe playground directory")
             
         return full_path
@@ -43,15 +45,16 @@ def list_files(directory: str = ".") -> Dict[str, Any]:
         if not target_path.is_dir():
             return {"error": f"{directory} is not a directory"}
         
+        # DirEntry caches the file type from the directory read, so only sizes need a stat
         items = []
-        for item in sorted(target_path.iterdir()):
-            relative_path = item.relative_to(PLAYGROUND_DIR)
-            items.append({
-                "name": item.name,
-                "path": str(relative_path),
-                "type": "directory" if item.is_dir() else "file",
-                "size": item.stat().st_size if item.is_file() else None
-            })
+        with os.scandir(target_path) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                items.append({
+                    "name": entry.name,
+                    "path": os.path.relpath(entry.path, _PLAYGROUND_ABS),
+                    "type": "directory" if entry.is_dir() else "file",
+                    "size": entry.stat().st_size if entry.is_file() else None
+                })
         
         return {
             "directory": directory,
@@ -67,17 +70,27 @@ def read_file(file_path: str) -> Dict[str, Any]:
     try:
         target_path = _ensure_safe_path(file_path)
         
-        if not target_path.exists():
+        # One open + fstat on the same descriptor instead of separate exists/is_file/stat calls.
+        # O_NONBLOCK keeps opening a FIFO from blocking before the type check rejects it.
+        try:
+            fd = os.open(target_path, os.O_RDONLY | getattr(os, 'O_NONBLOCK', 0))
+        except FileNotFoundError:
             return {"error": f"File {file_path} does not exist"}
-            
-        if not target_path.is_file():
-            return {"error": f"{file_path} is not a file"}
         
-        # Check file size (limit to 1MB for safety)
-        if target_path.stat().st_size > 1024 * 1024:
-            return {"error": "File too large (>1MB)"}
+        try:
+            file_stat = os.fstat(fd)
+            if not stat.S_ISREG(file_stat.st_mode):
+                return {"error": f"{file_path} is not a file"}
+            
+            # Check file size (limit to 1MB for safety)
+            if file_stat.st_size > 1024 * 1024:
+                return {"error": "File too large (>1MB)"}
+            
+            data = os.read(fd, file_stat.st_size)
+        finally:
+            os.close(fd)
         
-        content = target_path.read_text(encoding='utf-8')
+        content = data.decode('utf-8')
         return {
             "file_path": file_path,
             "content": content,
@@ -94,17 +107,42 @@ def write_file(file_path: str, content: str) -> Dict[str, Any]:
     try:
         target_path = _ensure_safe_path(file_path)
         
-        # Ensure parent directory exists
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+        # Encode once; the size limit and byte count both use the encoded data
+        data = content.encode('utf-8')
         
         # Limit content size (1MB)
-        if len(content) > 1024 * 1024:
+        if len(data) > 1024 * 1024:
             return {"error": "Content too large (>1MB)"}
         
-        target_path.write_text(content, encoding='utf-8')
+        # Ensure parent directory exists (the playground root always does)
+        if target_path.parent != _PLAYGROUND_ABS:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write to a temp file beside the target and rename it into place, so
+        # readers never see a half-written file
+        tmp_path = target_path.with_name(f".{target_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            try:
+                # The rename replaces the target's inode, so carry over its permissions
+                try:
+                    os.fchmod(fd, stat.S_IMODE(os.stat(target_path).st_mode))
+                except FileNotFoundError:
+                    pass
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
         return {
             "file_path": file_path,
-            "bytes_written": len(content.encode('utf-8')),
+            "bytes_written": len(data),
             "success": True
         }
     except Exception as e:
@@ -147,15 +185,17 @@ def delete_file(file_path: str) -> Dict[str, Any]:
     except Exception as e:
         return {"error": str(e)}
 
+_PLAYGROUND_INFO_JSON = json.dumps({
+    "playground_path": str(PLAYGROUND_DIR),
+    "description": "Safe file operations sandbox",
+    "max_file_size": "1MB",
+    "allowed_operations": ["list", "read", "write", "create_dir", "delete"]
+})
+
 @mcp.resource("file://playground_info")
 def get_playground_info() -> str:
     """Get information about the playground directory."""
-    return json.dumps({
-        "playground_path": str(PLAYGROUND_DIR),
-        "description": "Safe file operations sandbox",
-        "max_file_size": "1MB",
-        "allowed_operations": ["list", "read", "write", "create_dir", "delete"]
-    })
+    return _PLAYGROUND_INFO_JSON
 
 if __name__ == "__main__":
     mcp.run()
\ No newline at end of file
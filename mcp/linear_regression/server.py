@@ -4,80 +4,179 @@ Linear Regression MCP Server
 Provides linear regression analysis and prediction tools.
 """
 import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from fastmcp import FastMCP
 
 # Initialize the MCP server
 mcp = FastMCP("LinearRegression")
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _centered_moments_loop(x: np.ndarray, y: np.ndarray):
+    """Return (x_mean, y_mean, Sxx, Sxy, Syy) using explicit loops (compiled by Numba)."""
+    n = x.size
+    sum_x = 0.0
+    sum_y = 0.0
+    for i in range(n):
+        sum_x += x[i]
+        sum_y += y[i]
+    x_mean = sum_x / n
+    y_mean = sum_y / n
+    
+    # Second pass over centered values keeps the sums numerically stable
+    sxx = 0.0
+    sxy = 0.0
+    syy = 0.0
+    for i in range(n):
+        dx = x[i] - x_mean
+        dy = y[i] - y_mean
+        sxx += dx * dx
+        sxy += dx * dy
+        syy += dy * dy
+    return x_mean, y_mean, sxx, sxy, syy
+
+def _centered_moments_numpy(x: np.ndarray, y: np.ndarray):
+    """Return (x_mean, y_mean, Sxx, Sxy, Syy) using NumPy reductions."""
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    dy = y - y_mean
+    return x_mean, y_mean, dx @ dx, dx @ dy, dy @ dy
+
+def _compile_centered_moments(cache: bool):
+    """Compile the moments loop with Numba, warming it up so the first fit request doesn't pay the JIT cost."""
+    kernel = njit(cache=cache, fastmath=True, boundscheck=False)(_centered_moments_loop)
+    kernel(np.zeros(2), np.zeros(2))
+    return kernel
+
+_centered_moments = _centered_moments_numpy
+if NUMBA_AVAILABLE:
+    try:
+        _centered_moments = _compile_centered_moments(cache=True)
+    except Exception:
+        # The on-disk JIT cache is keyed on this file, so an entry written while it ran
+        # under another module name (or a stale one) fails to load; compile without it
+        logger.warning("Numba cache unusable, compiling the regression kernel without it", exc_info=True)
+        try:
+            _centered_moments = _compile_centered_moments(cache=False)
+        except Exception:
+            logger.warning("Numba kernel unavailable, using NumPy for regression moments", exc_info=True)
+
+@dataclass(frozen=True, slots=True)
 class RegressionResult:
+    """
+    Immutable snapshot of a fitted model.
+    
+    A new snapshot replaces the current one with a single reference
+    assignment, so concurrent readers never see fields from two different fits.
+    """
     slope: float
     intercept: float
     r_squared: float
-    predictions: Optional[List[float]] = None
-
-class LinearRegressionModel:
-    def __init__(self):
-        self.slope = None
-        self.intercept = None
-        self.r_squared = None
-        self.x_data = None
-        self.y_data = None
+    n_points: int
     
-    def fit(self, x: List[float], y: List[float]) -> RegressionResult:
-        """Fit linear regression model to data."""
-        if len(x) != len(y):
-            raise ValueError("X and Y data must have the same length")
-        if len(x) < 2:
-            raise ValueError("Need at least 2 data points for regression")
-        
-        x_array = np.array(x)
-        y_array = np.array(y)
-        
-        # Calculate slope and intercept using least squares
-        n = len(x)
-        sum_x = np.sum(x_array)
-        sum_y = np.sum(y_array)
-        sum_xy = np.sum(x_array * y_array)
-        sum_x_squared = np.sum(x_array ** 2)
-        
-        # Calculate slope (m) and intercept (b) for y = mx + b
-        denominator = n * sum_x_squared - sum_x ** 2
-        if abs(denominator) < 1e-10:
-            raise ValueError("Cannot perform regression: all X values are the same")
-        
-        self.slope = (n * sum_xy - sum_x * sum_y) / denominator
-        self.intercept = (sum_y - self.slope * sum_x) / n
-        
-        # Calculate R-squared
-        y_mean = np.mean(y_array)
-        ss_tot = np.sum((y_array - y_mean) ** 2)
-        y_pred = self.slope * x_array + self.intercept
-        ss_res = np.sum((y_array - y_pred) ** 2)
-        
-        self.r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 1.0
-        
-        self.x_data = x
-        self.y_data = y
-        
-        return RegressionResult(
-            slope=self.slope,
-            intercept=self.intercept,
-            r_squared=self.r_squared
-        )
+    def predict_array(self, x_array: np.ndarray) -> np.ndarray:
+        """Make predictions for an array of x values, returning an array."""
+        return self.slope * x_array + self.intercept
     
     def predict(self, x_values: List[float]) -> List[float]:
         """Make predictions using the fitted model."""
-        if self.slope is None or self.intercept is None:
-            raise ValueError("Model must be fitted before making predictions")
+        return self.predict_array(np.asarray(x_values, dtype=np.float64)).tolist()
+
+def fit(x: List[float], y: List[float]) -> RegressionResult:
+    """Fit linear regression model to data."""
+    if len(x) != len(y):
+        raise ValueError("X and Y data must have the same length")
+    if len(x) < 2:
+        raise ValueError("Need at least 2 data points for regression")
+    
+    x_array = np.ascontiguousarray(x, dtype=np.float64)
+    y_array = np.ascontiguousarray(y, dtype=np.float64)
+    
+    # Least squares on mean-centered data
+    x_mean, y_mean, sxx, sxy, syy = _centered_moments(x_array, y_array)
+    
+    if sxx < 1e-10:
+        raise ValueError("Cannot perform regression: all X values are the same")
+    
+    # Calculate slope (m) and intercept (b) for y = mx + b
+    slope = sxy / sxx
+    intercept = y_mean - slope * x_mean
+    
+    # For a least squares line, R-squared = Sxy^2 / (Sxx * Syy)
+    r_squared = (sxy * sxy) / (sxx * syy) if syy > 0 else 1.0
+    
+    return RegressionResult(
+        slope=slope,
+        intercept=intercept,
+        r_squared=r_squared,
+        n_points=x_array.size
+    )
+
+# Most recently fitted model; readers bind it once and use that snapshot
+_current: Optional[RegressionResult] = None
+
+# analyze_data responses keyed by a digest of the input arrays, LRU-bounded both by
+# entry count and by the residual values held, since responses grow with the input
+_ANALYSIS_CACHE_MAX_SIZE = 64
+_ANALYSIS_CACHE_MAX_POINTS = 1_000_000
+_analysis_cache: "OrderedDict[bytes, Tuple[RegressionResult, Dict[str, Any]]]" = OrderedDict()
+_analysis_cache_points = 0
+_analysis_cache_lock = threading.Lock()
+
+def _analysis_key(x_array: np.ndarray, y_array: np.ndarray) -> bytes:
+    """Digest both input arrays; hashing is cheap next to a full analysis pass."""
+    return (
+        hashlib.blake2b(x_array.tobytes(), digest_size=16).digest()
+        + hashlib.blake2b(y_array.tobytes(), digest_size=16).digest()
+    )
+
+def _get_cached_analysis(key: bytes) -> Optional[Tuple[RegressionResult, Dict[str, Any]]]:
+    """Return the cached (snapshot, response) for a dataset if present."""
+    with _analysis_cache_lock:
+        entry = _analysis_cache.get(key)
+        if entry is not None:
+            _analysis_cache.move_to_end(key)
+        return entry
+
+def _cache_analysis(key: bytes, result: RegressionResult, response: Dict[str, Any]):
+    """Cache an analysis, evicting least recently used entries while over either bound."""
+    global _analysis_cache_points
+    if result.n_points > _ANALYSIS_CACHE_MAX_POINTS:
+        return
+    
+    with _analysis_cache_lock:
+        previous = _analysis_cache.pop(key, None)
+        if previous is not None:
+            _analysis_cache_points -= previous[0].n_points
         
-        return [self.slope * x + self.intercept for x in x_values]
+        _analysis_cache[key] = (result, response)
+        _analysis_cache_points += result.n_points
+        while (
+            len(_analysis_cache) > _ANALYSIS_CACHE_MAX_SIZE
+            or _analysis_cache_points > _ANALYSIS_CACHE_MAX_POINTS
+        ):
+            _, (evicted, _) = _analysis_cache.popitem(last=False)
+            _analysis_cache_points -= evicted.n_points
 
-# Global model instance
-model = LinearRegressionModel()
+def _copy_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an analysis response's nested dicts and lists; their leaves are immutable numbers and strings."""
+    return {
+        key: _copy_response(value) if isinstance(value, dict) else list(value) if isinstance(value, list) else value
+        for key, value in response.items()
+    }
 
 @mcp.tool
 def fit_linear_regression(x_data: List[float], y_data: List[float]) -> Dict[str, Any]:
@@ -91,8 +190,10 @@ def fit_linear_regression(x_data: List[float], y_data: List[float]) -> Dict[str,
     Returns:
         Dictionary containing slope, intercept, and R-squared value
     """
+    global _current
     try:
-        result = model.fit(x_data, y_data)
+        result = fit(x_data, y_data)
+        _current = result
         
         return {
             "success": True,
@@ -121,17 +222,21 @@ def predict_values(x_values: List[float]) -> Dict[str, Any]:
         Dictionary containing predictions and model info
     """
     try:
-        predictions = model.predict(x_values)
+        snapshot = _current
+        if snapshot is None:
+            raise ValueError("Model must be fitted before making predictions")
+        
+        predictions = snapshot.predict(x_values)
         
         return {
             "success": True,
             "predictions": predictions,
             "x_values": x_values,
             "model_info": {
-                "slope": model.slope,
-                "intercept": model.intercept,
-                "r_squared": model.r_squared,
-                "equation": f"y = {model.slope:.4f}x + {model.intercept:.4f}"
+                "slope": snapshot.slope,
+                "intercept": snapshot.intercept,
+                "r_squared": snapshot.r_squared,
+                "equation": f"y = {snapshot.slope:.4f}x + {snapshot.intercept:.4f}"
             }
         }
     except Exception as e:
@@ -152,27 +257,38 @@ def analyze_data(x_data: List[float], y_data: List[float]) -> Dict[str, Any]:
     Returns:
         Dictionary containing full analysis results
     """
+    global _current
     try:
+        x_array = np.ascontiguousarray(x_data, dtype=np.float64)
+        y_array = np.ascontiguousarray(y_data, dtype=np.float64)
+        
+        # Repeat analyses of the same data skip the numeric pipeline entirely
+        key = _analysis_key(x_array, y_array)
+        cached = _get_cached_analysis(key)
+        if cached is not None:
+            _current = cached[0]
+            # Callers own the response they get back; mutating it must not change later hits
+            return _copy_response(cached[1])
+        
         # Fit the model
-        result = model.fit(x_data, y_data)
+        result = fit(x_array, y_array)
+        _current = result
         
         # Calculate additional statistics
-        x_array = np.array(x_data)
-        y_array = np.array(y_data)
-        
-        x_mean = np.mean(x_array)
-        y_mean = np.mean(y_array)
-        x_std = np.std(x_array)
-        y_std = np.std(y_array)
+        x_mean = x_array.mean()
+        y_mean = y_array.mean()
+        x_std = x_array.std()
+        y_std = y_array.std()
         
         # Calculate correlation coefficient
         correlation = np.corrcoef(x_array, y_array)[0, 1]
         
-        # Calculate residuals
-        predictions = model.predict(x_data)
-        residuals = [y_data[i] - predictions[i] for i in range(len(y_data))]
+        # Calculate residuals; stays an ndarray until the JSON boundary
+        residuals = y_array - result.predict_array(x_array)
+        residuals_mean = residuals.mean()
+        residuals_std = residuals.std()
         
-        return {
+        response = {
             "success": True,
             "regression": {
                 "slope": result.slope,
@@ -187,13 +303,13 @@ def analyze_data(x_data: List[float], y_data: List[float]) -> Dict[str, Any]:
                 "y_mean": y_mean,
                 "x_std": x_std,
                 "y_std": y_std,
-                "x_range": [float(min(x_array)), float(max(x_array))],
-                "y_range": [float(min(y_array)), float(max(y_array))]
+                "x_range": [float(x_array.min()), float(x_array.max())],
+                "y_range": [float(y_array.min()), float(y_array.max())]
             },
             "residuals": {
-                "values": residuals,
-                "mean": np.mean(residuals),
-                "std": np.std(residuals)
+                "values": residuals.tolist(),
+                "mean": residuals_mean,
+                "std": residuals_std
             },
             "interpretation": {
                 "fit_quality": _interpret_r_squared(result.r_squared),
@@ -201,6 +317,8 @@ def analyze_data(x_data: List[float], y_data: List[float]) -> Dict[str, Any]:
                 "slope_interpretation": _interpret_slope(result.slope)
             }
         }
+        _cache_analysis(key, result, _copy_response(response))
+        return response
     except Exception as e:
         return {
             "success": False,
@@ -215,7 +333,8 @@ def get_model_info() -> Dict[str, Any]:
     Returns:
         Dictionary containing current model parameters
     """
-    if model.slope is None:
+    snapshot = _current
+    if snapshot is None:
         return {
             "fitted": False,
             "message": "No model has been fitted yet"
@@ -223,12 +342,12 @@ def get_model_info() -> Dict[str, Any]:
     
     return {
         "fitted": True,
-        "slope": model.slope,
-        "intercept": model.intercept,
-        "r_squared": model.r_squared,
-        "equation": f"y = {model.slope:.4f}x + {model.intercept:.4f}",
-        "data_points": len(model.x_data) if model.x_data else 0,
-        "fit_quality": _interpret_r_squared(model.r_squared)
+        "slope": snapshot.slope,
+        "intercept": snapshot.intercept,
+        "r_squared": snapshot.r_squared,
+        "equation": f"y = {snapshot.slope:.4f}x + {snapshot.intercept:.4f}",
+        "data_points": snapshot.n_points,
+        "fit_quality": _interpret_r_squared(snapshot.r_squared)
     }
 
 def _interpret_r_squared(r_squared: float) -> str:
@@ -268,30 +387,31 @@ def _interpret_slope(slope: float) -> str:
     else:
         return f"For each unit increase in X, Y decreases by {abs(slope):.4f} units"
 
+_REGRESSION_GUIDE_JSON = json.dumps({
+    "description": "Linear Regression Analysis Tools",
+    "tools": {
+        "fit_linear_regression": "Fit a linear regression model to x,y data",
+        "predict_values": "Make predictions using the fitted model",
+        "analyze_data": "Comprehensive analysis including statistics and residuals",
+        "get_model_info": "Get information about the current fitted model"
+    },
+    "workflow": [
+        "1. Use fit_linear_regression or analyze_data with your x,y data",
+        "2. Check the R-squared value to assess fit quality",
+        "3. Use predict_values to make predictions for new x values",
+        "4. Use get_model_info to review current model parameters"
+    ],
+    "interpretation": {
+        "r_squared": "Closer to 1.0 indicates better fit",
+        "slope": "Rate of change in Y per unit change in X",
+        "intercept": "Y value when X equals zero"
+    }
+}, indent=2)
+
 @mcp.resource("file://regression_guide")
 def get_regression_guide() -> str:
     """Get a guide for using linear regression tools."""
-    guide = {
-        "description": "Linear Regression Analysis Tools",
-        "tools": {
-            "fit_linear_regression": "Fit a linear regression model to x,y data",
-            "predict_values": "Make predictions using the fitted model",
-            "analyze_data": "Comprehensive analysis including statistics and residuals",
-            "get_model_info": "Get information about the current fitted model"
-        },
-        "workflow": [
-            "1. Use fit_linear_regression or analyze_data with your x,y data",
-            "2. Check the R-squared value to assess fit quality",
-            "3. Use predict_values to make predictions for new x values",
-            "4. Use get_model_info to review current model parameters"
-        ],
-        "interpretation": {
-            "r_squared": "Closer to 1.0 indicates better fit",
-            "slope": "Rate of change in Y per unit change in X",
-            "intercept": "Y value when X equals zero"
-        }
-    }
-    return json.dumps(guide, indent=2)
+    return _REGRESSION_GUIDE_JSON
 
 if __name__ == "__main__":
     mcp.run()
\ No newline at end of file
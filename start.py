@@ -1,49 +1,131 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
-import subprocess
 from pathlib import Path
 
+# KEY=VALUE lines for the fallback .env parser, following python-dotenv for single-line
+# entries: optional "export", single or double quoted values, and " #" comments after
+# the value. Comment-only and blank lines never match.
+_ENV_LINE_RE = re.compile(
+    r'^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*'
+    r'(?:"([^"\r\n]*)"|\'([^\'\r\n]*)\'|(?!["\'])([^\r\n]*?))'
+    r'[ \t]*(?:[ \t]#[^\r\n]*)?\r?$',
+    re.MULTILINE
+)
+
+# path -> (mtime, parsed contents) so repeat loads in one process don't re-parse
+_ENV_CACHE: dict = {}
+
+def _read_env_file(env_file: Path) -> dict:
+    """Return the parsed contents of a .env file, re-parsing only when its mtime changes."""
+    path = str(env_file)
+    mtime = env_file.stat().st_mtime_ns
+    entry = _ENV_CACHE.get(path)
+    if entry is None or entry[0] != mtime:
+        entry = _ENV_CACHE[path] = (mtime, _parse_env_file(env_file))
+    return entry[1]
+
+def _parse_env_file(env_file: Path) -> dict:
+    """Parse a .env file into a dict, using python-dotenv's parser when installed."""
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        # Minimal KEY=VALUE parser for interpreters without the project's dependencies
+        return {
+            key: double_quoted or single_quoted or unquoted
+            for key, double_quoted, single_quoted, unquoted in _ENV_LINE_RE.findall(env_file.read_text())
+        }
+    
+    # Keys without a value (a bare "KEY" line) parse as None and are skipped. Values are
+    # taken literally, so secrets containing "${...}" aren't expanded.
+    values = dotenv_values(env_file, interpolate=False)
+    return {key: value for key, value in values.items() if value is not None}
+
 def main():
     """Start the LLM Frontend application"""
-    project_root = Path(__file__).parent
+    project_root = Path(__file__).resolve().parent
+    # Auto-reload keeps a file watcher process running, so it's opt-in
+    dev_mode = "--dev" in sys.argv[1:]
+    # Built once as strings; every consumer below (os, sys.path, uvicorn) takes str
+    backend_dir = str(project_root / "backend")
+    app_dir = os.path.join(backend_dir, "app")
     
-    if not (project_root / "backend").exists():
+    # One directory listing checks for both backend/ and backend/app
+    try:
+        with os.scandir(backend_dir) as entries:
+            backend_entries = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
         print("Error: Backend directory not found!")
         sys.exit(1)
     
     os.chdir(project_root)
     
-    if not (project_root / "backend" / "app").exists():
+    if "app" not in backend_entries:
         print("Error: App directory not found in backend!")
         sys.exit(1)
     
-    print("Starting LLM Frontend with uv...")
-    print("Backend will be available at http://localhost:8000")
-    print("Frontend will be available at http://localhost:8000/")
-    print("Press Ctrl+C to stop")
+    # One write for the whole banner; flushed now because exec would discard buffered output
+    sys.stdout.write(
+        "Starting LLM Frontend...\n"
+        "Backend will be available at http://localhost:8000\n"
+        "Frontend will be available at http://localhost:8000/\n"
+        + ("Auto-reload enabled (--dev)\n" if dev_mode else "")
+        + "Press Ctrl+C to stop\n"
+    )
+    sys.stdout.flush()
     
     try:
         # Load .env file
         env_file = project_root / ".env"
         if env_file.exists():
-            with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        os.environ[key] = value
+            # Parse the whole file, then apply it to the environment in one update.
+            # Variables already set in the shell take precedence and aren't rewritten.
+            parsed = _read_env_file(env_file)
+            os.environ.update({key: value for key, value in parsed.items() if key not in os.environ})
+        
+        # Set in place; both launch paths inherit os.environ, so no copy is needed
+        os.environ["PYTHONPATH"] = backend_dir
+        os.chdir(backend_dir)
+        
+        server_options = {
+            "host": "0.0.0.0",
+            "port": 8000,
+            "reload": dev_mode,
+            # Watch only the application package, not tests or other backend files
+            "reload_dirs": [app_dir] if dev_mode else None
+        }
+        
+        venv_dir = project_root / os.environ.get("UV_PROJECT_ENVIRONMENT", ".venv")
+        
+        # Serving in this interpreter avoids starting uv and a second Python, but only
+        # the project's own environment has the locked dependencies; any other Python
+        # that happens to have uvicorn installed goes through the exec below instead.
+        # Imported only now so the error exits above don't pay for uvicorn/FastAPI.
+        uvicorn = None
+        if Path(sys.prefix).resolve() == venv_dir.resolve():
+            try:
+                import uvicorn
+            except ImportError:
+                pass
+        
+        if uvicorn is not None:
+            sys.path.insert(0, backend_dir)
+            uvicorn.run("app.main:app", **server_options)
+            return
         
-        env = os.environ.copy()
-        env["PYTHONPATH"] = str(project_root / "backend")
+        # Run in the project's environment instead. exec replaces this process, so
+        # no idle parent waits on the server. When uv has already created the
+        # virtualenv, its interpreter is run directly rather than asking uv to
+        # resolve it again.
+        venv_python = venv_dir / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+        python_command = [str(venv_python)] if venv_python.exists() else ["uv", "run", "python"]
         
-        subprocess.run([
-            "uv", "run", "python", "-m", "uvicorn", 
-            "app.main:app", 
-            "--host", "0.0.0.0", 
-            "--port", "8000",
-            "--reload"
-        ], env=env, cwd=project_root / "backend")
+        # Call uvicorn.run directly with the same options rather than going through
+        # "-m uvicorn" and its click command-line parsing
+        launch = f"import uvicorn; uvicorn.run('app.main:app', **{server_options!r})"
+        args = [*python_command, "-c", launch]
+        os.execvp(args[0], args)
     except KeyboardInterrupt:
         print("\nShutting down...")
     except Exception as e: